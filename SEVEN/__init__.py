@@ -7,6 +7,6 @@
 # ============================================================
 """SEVEN AI backend package."""
 
-from .router import route_prompt
+from .router import aroute_prompt, route_prompt, route_prompts
 
-__all__ = ["route_prompt"]
+__all__ = ["aroute_prompt", "route_prompt", "route_prompts"]
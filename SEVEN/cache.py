@@ -0,0 +1,238 @@
+# ============================================================
+#  File: cache.py
+#  Project: SEVEN (Sustainable Energy via Efficient Neural-routing)
+#  Description: Response caches that let the router skip repeat inference.
+#  Author(s): Team SEVEN
+#  Date: 2026-10-15
+# ============================================================
+"""Response caches that let SEVEN answer repeated prompts without inference.
+
+A cache hit is the most energy-efficient route of all: no local or cloud
+model runs. The exact cache only serves identical requests in the
+deterministic (near-zero temperature) regime and is always on. The semantic
+cache matches near-duplicate prompts by embedding similarity and is opt-in
+because it needs optional dependencies and can return an earlier sample for
+a reworded question.
+
+Environment Variables (all optional):
+    SEVEN_SEMANTIC_CACHE: Set to 1/true to enable the semantic cache (default: off)
+    SEVEN_SEMANTIC_CACHE_PATH: .npz file to load on start and save on exit (default: None)
+    SEVEN_SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity for a hit (default: 0.95)
+    SEVEN_EMBEDDING_MODEL: sentence-transformers model name (default: all-MiniLM-L6-v2)
+
+Optional dependencies for the semantic cache: numpy, sentence-transformers.
+"""
+
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+
+    try:
+        from .semantic_cache import SemanticCache
+    except ImportError:
+        from semantic_cache import SemanticCache
+
+LOGGER = logging.getLogger(__name__)
+EXACT_CACHE_MAXSIZE = 2048
+DETERMINISTIC_MAX_TEMPERATURE = 0.1
+
+# Response fields describing the energy of the run that produced it
+_ENERGY_FIELDS = frozenset(
+    {"energy", "baseline_energy", "energy_savings_wh", "energy_savings_kwh"}
+)
+
+
+def _env_flag(name: str) -> bool:
+    """Return True when an environment variable is set to a truthy value."""
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _similarity_threshold() -> Optional[float]:
+    """Return the semantic-hit threshold from the environment."""
+    raw_value = os.getenv("SEVEN_SEMANTIC_CACHE_THRESHOLD")
+    try:
+        return float(raw_value) if raw_value else None
+    except ValueError:
+        LOGGER.warning("Ignoring invalid SEVEN_SEMANTIC_CACHE_THRESHOLD=%r", raw_value)
+        return None
+
+
+def context_digest(*parts: Any) -> int:
+    """Hash the non-prompt request settings into a stable signed 64-bit key."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def as_cache_hit(response: Any, latency_s: float) -> Any:
+    """Copy a cached response for reuse, dropping the original run's energy data.
+
+    A hit runs no model, so reporting the original energy again would
+    double-count it in the usage totals.
+    """
+    cleared = {
+        field.name: None
+        for field in dataclasses.fields(response)
+        if field.name in _ENERGY_FIELDS
+    }
+    return dataclasses.replace(response, latency_s=latency_s, **cleared)
+
+
+def request_digest(
+    prompt: str, system_prompt: Optional[str], temperature: float, max_tokens: int
+) -> bytes:
+    """Return the exact-cache key for a normalized request."""
+    key = (prompt.strip(), system_prompt, round(temperature, 3), max_tokens)
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).digest()
+
+
+class ExactCache:
+    """Thread-safe LRU map from a request digest to its response."""
+
+    def __init__(self, maxsize: int = EXACT_CACHE_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached response for key, marking it most recently used."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: bytes, response: Any) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+
+EXACT_CACHE = ExactCache()
+
+_SEMANTIC_CACHE: Optional[SemanticCache] = None
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+_SEMANTIC_CACHE_READY = False
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Return the process-wide semantic cache, or None when it is disabled."""
+    global _SEMANTIC_CACHE, _SEMANTIC_CACHE_READY
+
+    if _SEMANTIC_CACHE_READY:
+        return _SEMANTIC_CACHE
+    with _SEMANTIC_CACHE_LOCK:
+        if _SEMANTIC_CACHE_READY:
+            return _SEMANTIC_CACHE
+        _SEMANTIC_CACHE_READY = True
+        if not _env_flag("SEVEN_SEMANTIC_CACHE"):
+            return None
+        if any(
+            importlib.util.find_spec(module) is None
+            for module in ("numpy", "sentence_transformers")
+        ):
+            LOGGER.warning(
+                "SEVEN_SEMANTIC_CACHE is set but numpy/sentence-transformers "
+                "are not installed; semantic cache disabled."
+            )
+            return None
+
+        try:
+            from .semantic_cache import SemanticCache
+        except ImportError:
+            from semantic_cache import SemanticCache
+
+        options: dict[str, Any] = {}
+        threshold = _similarity_threshold()
+        if threshold is not None:
+            options["threshold"] = threshold
+        model_name = os.getenv("SEVEN_EMBEDDING_MODEL")
+        if model_name:
+            options["model_name"] = model_name
+        cache = SemanticCache(**options)
+        path = os.getenv("SEVEN_SEMANTIC_CACHE_PATH")
+        if path:
+            if os.path.exists(path):
+                try:
+                    cache.load(path)
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOGGER.warning("Could not load semantic cache from %s: %s", path, exc)
+            atexit.register(cache.save, path)
+        _SEMANTIC_CACHE = cache
+        return cache
+
+
+def preload_semantic_cache() -> None:
+    """Load the semantic cache and its embedding model on a background thread.
+
+    Does nothing unless SEVEN_SEMANTIC_CACHE is enabled, so default startups
+    never pay for the model.
+    """
+    if not _env_flag("SEVEN_SEMANTIC_CACHE"):
+        return
+    threading.Thread(
+        target=_warm_semantic_cache, name="seven-semantic-cache-warmup", daemon=True
+    ).start()
+
+
+def _warm_semantic_cache() -> None:
+    """Build the semantic cache and load its embedder ahead of the first prompt."""
+    cache = get_semantic_cache()
+    if cache is None:
+        return
+    try:
+        from .semantic_cache import get_embedder
+    except ImportError:
+        from semantic_cache import get_embedder
+
+    try:
+        get_embedder(cache.model_name)
+    except Exception as exc:  # pylint: disable=broad-except
+        LOGGER.warning("Semantic cache warm-up failed: %s", exc)
+
+
+def semantic_lookup(
+    cache: SemanticCache, prompt: str, context: int
+) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+    """Look up a prompt, returning (cached response, embedding for a later insert).
+
+    Failures (e.g. the model can't be downloaded) are logged and treated as a
+    miss with no embedding, so routing never depends on the cache.
+    """
+    try:
+        embedding = cache.embed(prompt)
+        return cache.lookup(embedding, context), embedding
+    except Exception as exc:  # pylint: disable=broad-except
+        LOGGER.warning("Semantic cache lookup failed: %s", exc)
+        return None, None
+
+
+def semantic_insert(
+    cache: SemanticCache, embedding: np.ndarray, context: int, response: Any
+) -> None:
+    """Store a routed response, logging failures so the answer is still returned."""
+    try:
+        cache.insert(embedding, context, response)
+    except Exception as exc:  # pylint: disable=broad-except
+        LOGGER.warning("Semantic cache insert failed: %s", exc)
@@ -19,6 +19,8 @@ All heuristics are based on:
 
 from __future__ import annotations
 
+import functools
+import re
 from typing import Optional
 
 # Support both package and direct script execution
@@ -27,6 +29,11 @@ try:
 except ImportError:
     from local_model import LocalModelResponse
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
 # ============================================================
 # Tunable Constants
 # ============================================================
@@ -146,9 +153,63 @@ UNCERTAINTY_PHRASES = [
     "i cannot answer",
 ]
 
+# Every uncertainty phrase as one alternation, searched in a single call
+_UNCERTAINTY_RE = re.compile("|".join(map(re.escape, UNCERTAINTY_PHRASES)))
+
 # Maximum words before considering query too complex
 MAX_LOCAL_WORD_COUNT = 150
 
+# Longer prompts are classified without memoizing to keep the cache small
+_CLASSIFY_CACHE_MAX_CHARS = 2048
+
+# Keyword categories in priority order (lower value wins when several match)
+_REALTIME, _SPECIALIZED, _COMPLEX = 0, 1, 2
+_KEYWORD_CATEGORIES = (
+    (_REALTIME, REALTIME_KEYWORDS),
+    (_SPECIALIZED, SPECIALIZED_DOMAINS),
+    (_COMPLEX, COMPLEX_MARKERS),
+)
+
+
+def _build_keyword_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Compile every routing keyword into one Aho-Corasick automaton, if available.
+
+    With pyahocorasick installed, classification is a single pass over the
+    prompt regardless of keyword count; otherwise per-category scans are used.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category, keywords in _KEYWORD_CATEGORIES:
+        for keyword in keywords:
+            # Keep the highest-priority category for keywords listed twice
+            if keyword not in automaton:
+                automaton.add_word(keyword, category)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _keyword_category(lowered: str) -> Optional[int]:
+    """Return the highest-priority keyword category found in a lowered prompt."""
+    if _KEYWORD_AUTOMATON is not None:
+        best: Optional[int] = None
+        for _, category in _KEYWORD_AUTOMATON.iter(lowered):
+            if category == _REALTIME:
+                return category
+            if best is None or category < best:
+                best = category
+        return best
+
+    for category, keywords in _KEYWORD_CATEGORIES:
+        if any(keyword in lowered for keyword in keywords):
+            return category
+    return None
+
+
 # ============================================================
 # Pre-routing Classification
 # ============================================================
@@ -181,30 +242,45 @@ def classify_query_type(prompt: str) -> dict[str, str]:
         >>> classify_query_type("Explain quantum chromodynamics")
         {'route': 'CLOUD', 'reason': 'specialized_domain'}
     """
-    if not prompt or not prompt.strip():
+    # Collapse case and whitespace so trivially different prompts share a cache entry
+    normalized = " ".join(prompt.lower().split()) if prompt else ""
+    if not normalized:
         return {"route": "LOCAL", "reason": "empty_prompt"}
 
-    lowered = prompt.lower()
-    word_count = len(prompt.split())
+    if len(normalized) <= _CLASSIFY_CACHE_MAX_CHARS:
+        route, reason = _classify_normalized(normalized)
+    else:
+        route, reason = _classify_normalized.__wrapped__(normalized)
+    return {"route": route, "reason": reason}
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_normalized(normalized: str) -> tuple[str, str]:
+    """Return (route, reason) for a lowercased, whitespace-collapsed prompt."""
+    word_count = normalized.count(" ") + 1
+    category = _keyword_category(normalized)
 
     # Check 1: Real-time data requirements (highest priority)
-    if any(keyword in lowered for keyword in REALTIME_KEYWORDS):
-        return {"route": "API_CHECK", "reason": "needs_realtime_data"}
+    if category == _REALTIME:
+        return "API_CHECK", "needs_realtime_data"
 
     # Check 2: Specialized domain knowledge
-    if any(domain in lowered for domain in SPECIALIZED_DOMAINS):
-        return {"route": "CLOUD", "reason": "specialized_domain"}
+    if category == _SPECIALIZED:
+        return "CLOUD", "specialized_domain"
 
     # Check 3: Obviously too complex for small models
-    if any(marker in lowered for marker in COMPLEX_MARKERS):
-        return {"route": "CLOUD", "reason": "too_complex_for_small_model"}
+    if category == _COMPLEX:
+        return "CLOUD", "too_complex_for_small_model"
 
     # Check 4: Length-based complexity
     if word_count > MAX_LOCAL_WORD_COUNT:
-        return {"route": "CLOUD", "reason": "prompt_too_long"}
+        return "CLOUD", "prompt_too_long"
 
     # Default: Try local (energy-efficient)
-    return {"route": "LOCAL", "reason": "default_energy_saving"}
+    return "LOCAL", "default_energy_saving"
+
+
+classify_query_type.cache_clear = _classify_normalized.cache_clear  # type: ignore[attr-defined]
 
 
 def detect_api_intent(prompt: str) -> Optional[str]:
@@ -229,7 +305,8 @@ def response_shows_uncertainty(response: LocalModelResponse) -> bool:
 
     Analyzes response text for explicit uncertainty markers like
     "I don't know" or "I'm not sure". Does not penalize short but
-    correct answers.
+    correct answers, and treats answers that open with a code block
+    as confident without scanning them.
 
     Args:
         response: LocalModelResponse object from ask_local().
@@ -251,11 +328,16 @@ def response_shows_uncertainty(response: LocalModelResponse) -> bool:
         >>> response_shows_uncertainty(resp)
         False
     """
-    text = response.text.lower().strip()
+    text = response.text.lstrip()
 
     # Empty response is a sign of failure
     if not text:
         return True
 
+    # Answers that open with a code block commit to a result; skip lowering
+    # and scanning them
+    if text.startswith("```"):
+        return False
+
     # Check for explicit uncertainty markers
-    return any(phrase in text for phrase in UNCERTAINTY_PHRASES)
+    return _UNCERTAINTY_RE.search(text.lower()) is not None
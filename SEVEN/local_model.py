@@ -39,8 +39,6 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, Optional
 from urllib.parse import urljoin
 
-import requests
-
 if TYPE_CHECKING:  # pragma: no cover - typing only
     try:
         from .energy import EnergyEstimate
@@ -263,6 +261,9 @@ def ask_local(
     if not prompt or not prompt.strip():
         raise ValueError("Prompt must be a non-empty string.")
 
+    # Deferred so importing the router (e.g. while the TUI starts) skips requests
+    import requests
+
     spinner = Spinner("Processing Locally")
     spinner.start()
     try:
@@ -15,6 +15,34 @@ This module contains all prompt engineering logic, making it easy to:
 
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
+
+# Lead with confidence and encouragement
+_CONFIDENCE_GUIDELINE = (
+    "You know science, math, history, famous people, and general topics well. "
+    "Answer clearly and include relevant context to be helpful. "
+    "Keep responses concise but complete."
+)
+
+# Simple safety rule
+_DECLINE_GUIDELINE = (
+    'Only say "I\'m not sure" for truly obscure questions (like someone\'s relatives or niche memes). '
+    "Don't decline for well-known topics."
+)
+
+# Guidelines block shared by every prompt without a risk hint
+_DEFAULT_GUIDELINES = f"{_CONFIDENCE_GUIDELINE}\n{_DECLINE_GUIDELINE}"
+
+# Longer queries are rendered without memoizing to keep the cache small
+_PROMPT_CACHE_MAX_CHARS = 4096
+
+# Instruction used to force a decline so the router escalates to cloud
+_ESCALATE_PREFIX = (
+    "This query exceeds the safe local knowledge boundary.\n"
+    'Respond exactly with: "I\'m not sure - please use the cloud model."\n\n'
+)
+
 
 def get_api_synthesis_prompt(api_data: str, user_query: str) -> str:
     """Generate prompt for synthesizing API data with user query.
@@ -81,6 +109,76 @@ def get_system_prompt_cloud() -> str:
     )
 
 
+@dataclass(frozen=True)
+class PromptSegment:
+    """Slice of a local prompt, flagged when it is identical across requests.
+
+    Static segments always come first so backends with prefix caching can reuse
+    them; backends with explicit cache markers can tag the cacheable ones.
+    """
+
+    text: str
+    cacheable: bool = False
+
+
+_DEFAULT_GUIDELINES_SEGMENT = PromptSegment(
+    f"GUIDELINES:\n{_DEFAULT_GUIDELINES}\n", cacheable=True
+)
+_ESCALATE_SEGMENT = PromptSegment(_ESCALATE_PREFIX, cacheable=True)
+
+
+def build_local_prompt_segments(
+    user_query: str,
+    api_data: str | None = None,
+    risk_hint: str | None = None,
+    allow_richer_context: bool = False,
+    escalate_immediately: bool = False,
+) -> list[PromptSegment]:
+    """Construct the local SLM prompt as ordered static/dynamic segments.
+
+    Takes the same arguments as build_local_prompt(); joining the segment texts
+    yields exactly the prompt that function returns.
+
+    Returns:
+        Segments in prompt order, with the request-independent prefix marked cacheable.
+    """
+    if escalate_immediately:
+        return [
+            _ESCALATE_SEGMENT,
+            PromptSegment(f"User question: {user_query}"),
+        ]
+
+    # Only add extra caution if there's a specific risk; otherwise reuse the
+    # precomputed block so the common path does no list building or joining
+    if risk_hint:
+        guidelines_segment = PromptSegment(
+            "GUIDELINES:\n"
+            f"{_CONFIDENCE_GUIDELINE}\n"
+            f"Note: {risk_hint} - only decline if you're genuinely unsure.\n"
+            f"{_DECLINE_GUIDELINE}\n"
+        )
+    else:
+        guidelines_segment = _DEFAULT_GUIDELINES_SEGMENT
+
+    # Add API data block if present
+    stripped_api_data = api_data.strip() if api_data else ""
+    api_block = (
+        f"\nREAL-TIME DATA (use this to answer):\n{stripped_api_data}\n"
+        if stripped_api_data
+        else ""
+    )
+
+    # Build final prompt (identity is in system_prompt, this is just the user message)
+    return [
+        guidelines_segment,
+        PromptSegment(
+            f"{api_block}\n"
+            f"USER QUESTION: {user_query}\n\n"
+            f"YOUR RESPONSE:"
+        ),
+    ]
+
+
 def build_local_prompt(
     user_query: str,
     api_data: str | None = None,
@@ -100,51 +198,33 @@ def build_local_prompt(
     Returns:
         A formatted prompt string ready to send to the local model.
     """
-    if escalate_immediately:
-        return (
-            "This query exceeds the safe local knowledge boundary.\n"
-            'Respond exactly with: "I\'m not sure - please use the cloud model."\n\n'
-            f"User question: {user_query}"
-        )
-
-    # Build instructions based on context
-    instructions: list[str] = []
-
-    # Lead with confidence and encouragement
-    instructions.append(
-        "You know science, math, history, famous people, and general topics well. "
-        "Answer clearly and include relevant context to be helpful. "
-        "Keep responses concise but complete."
-    )
-
-    # Only add extra caution if there's a specific risk
-    if risk_hint:
-        instructions.append(
-            f"Note: {risk_hint} - only decline if you're genuinely unsure."
-        )
-
-    # Simple safety rule
-    instructions.append(
-        'Only say "I\'m not sure" for truly obscure questions (like someone\'s relatives or niche memes). '
-        "Don't decline for well-known topics."
+    # Live API payloads differ on every call, so memoizing them only evicts
+    # the reusable entries
+    render = (
+        _render_local_prompt
+        if api_data is None and len(user_query) <= _PROMPT_CACHE_MAX_CHARS
+        else _render_local_prompt.__wrapped__
     )
+    return render(user_query, api_data, risk_hint, allow_richer_context, escalate_immediately)
 
-    # Format the guidelines
-    guidelines = "\n".join(f"{rule}" for rule in instructions)
 
-    # Add API data block if present
-    api_block = ""
-    if api_data and api_data.strip():
-        api_block = f"\nREAL-TIME DATA (use this to answer):\n{api_data.strip()}\n"
-
-    # Build final prompt (identity is in system_prompt, this is just the user message)
-    prompt = (
-        f"GUIDELINES:\n{guidelines}\n"
-        f"{api_block}\n"
-        f"USER QUESTION: {user_query}\n\n"
-        f"YOUR RESPONSE:"
+@functools.lru_cache(maxsize=1024)
+def _render_local_prompt(
+    user_query: str,
+    api_data: str | None,
+    risk_hint: str | None,
+    allow_richer_context: bool,
+    escalate_immediately: bool,
+) -> str:
+    """Join the prompt segments; memoized since the output is a pure function of the inputs."""
+    segments = build_local_prompt_segments(
+        user_query,
+        api_data=api_data,
+        risk_hint=risk_hint,
+        allow_richer_context=allow_richer_context,
+        escalate_immediately=escalate_immediately,
     )
-    return prompt
+    return "".join(segment.text for segment in segments)
 
 
 def get_fallback_note() -> str:
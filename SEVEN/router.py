@@ -19,15 +19,29 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import re
 import sys
-from typing import Callable, Optional, Union
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import cache, partial
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union
 
 # Support both package and direct script execution
 try:
-    from .api_check import run_api_check
-    from .cloud_model import CloudModelError, CloudModelResponse, ask_cloud
+    from .cache import (
+        DETERMINISTIC_MAX_TEMPERATURE,
+        EXACT_CACHE,
+        as_cache_hit,
+        context_digest,
+        get_semantic_cache,
+        request_digest,
+        semantic_insert,
+        semantic_lookup,
+    )
     from .energy import (
         CloudProfile,
         LocalProfile,
@@ -39,8 +53,16 @@ try:
     from .local_model import LemonadeClientError, LocalModelResponse, ask_local
     from .prompts import build_local_prompt, get_system_prompt_local
 except ImportError:
-    from api_check import run_api_check
-    from cloud_model import CloudModelError, CloudModelResponse, ask_cloud
+    from cache import (
+        DETERMINISTIC_MAX_TEMPERATURE,
+        EXACT_CACHE,
+        as_cache_hit,
+        context_digest,
+        get_semantic_cache,
+        request_digest,
+        semantic_insert,
+        semantic_lookup,
+    )
     from energy import (
         CloudProfile,
         LocalProfile,
@@ -52,7 +74,14 @@ except ImportError:
     from local_model import LemonadeClientError, LocalModelResponse, ask_local
     from prompts import build_local_prompt, get_system_prompt_local
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    try:
+        from .cloud_model import CloudModelResponse
+    except ImportError:
+        from cloud_model import CloudModelResponse
+
 LOGGER = logging.getLogger(__name__)
+_NONSPACE_RE = re.compile(r"\S")
 _LOCAL_PROFILE, _CLOUD_PROFILE = select_profiles(
     local=os.getenv("SEVEN_LOCAL_PROFILE"),
     cloud=os.getenv("SEVEN_CLOUD_PROFILE"),
@@ -71,6 +100,7 @@ def route_prompt(
     on_status_change: Optional[Callable[[str], None]] = None,
     local_energy_profile: Optional[Union[str, LocalProfile]] = None,
     cloud_energy_profile: Optional[Union[str, CloudProfile]] = None,
+    hedge_after_s: Optional[float] = None,
 ) -> Union[LocalModelResponse, CloudModelResponse]:
     """Route prompts to local or cloud models with intelligent pre/post-routing.
 
@@ -83,6 +113,9 @@ def route_prompt(
         enable_realtime_apis: If True, augment local responses with real-time APIs when needed.
         auto_escalate: If True, retry with cloud if local shows uncertainty (default: True).
         on_status_change: Optional callback for routing status updates (e.g., "local_starting", "api_fetching").
+        hedge_after_s: If set, start a cloud call when the local model hasn't answered
+            within this many seconds and return whichever succeeds first. Disabled by
+            default because the hedged cloud call spends energy even when local wins.
 
     Returns:
         LocalModelResponse or CloudModelResponse with .text, .model, .latency_s, etc.
@@ -96,10 +129,14 @@ def route_prompt(
         2. Uses local model by default (Lemonade Server) for energy efficiency
         3. Post-routing validation catches model uncertainty and auto-escalates
         4. Falls back to cloud only when necessary
+        5. Repeated deterministic requests are answered from an exact-match cache
+        6. Optional semantic cache answers near-duplicate prompts with no inference
     """
-    if not prompt or not prompt.strip():
+    if not prompt or not _NONSPACE_RE.search(prompt):
         raise ValueError("Prompt must be a non-empty string.")
 
+    notify = on_status_change
+
     active_local_profile, active_cloud_profile = select_profiles(
         local=local_energy_profile,
         cloud=cloud_energy_profile,
@@ -110,8 +147,8 @@ def route_prompt(
     # Forced cloud mode (skip all local attempts)
     if use_cloud:
         LOGGER.info("Routing to cloud (use_cloud=True)")
-        if on_status_change:
-            on_status_change("cloud_processing")
+        if notify is not None:
+            notify("cloud_processing")
         return _call_cloud(
             prompt,
             system_prompt=system_prompt,
@@ -122,83 +159,140 @@ def route_prompt(
 
     # Pre-routing heuristics (zero cost)
     classification = classify_query_type(prompt)
-    LOGGER.info(
-        "Pre-routing classification: %s (%s)",
-        classification["route"],
-        classification["reason"],
-    )
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(
+            "Pre-routing classification: %s (%s)",
+            classification["route"],
+            classification["reason"],
+        )
     needs_realtime_data = classification["route"] == "API_CHECK"
 
+    # Reuse an earlier answer when one is cached; real-time data is never cached
+    exact_key: Optional[bytes] = None
+    semantic_cache = None
+    if not needs_realtime_data:
+        started = time.perf_counter()
+        if temperature <= DETERMINISTIC_MAX_TEMPERATURE:
+            exact_key = request_digest(prompt, system_prompt, temperature, max_tokens)
+            cached = EXACT_CACHE.get(exact_key)
+            if cached is not None:
+                LOGGER.info("Exact cache hit; skipping inference")
+                return as_cache_hit(cached, time.perf_counter() - started)
+
+        semantic_cache = get_semantic_cache()
+        if semantic_cache is not None:
+            context = context_digest(system_prompt, round(temperature, 3), max_tokens)
+            cached, embedding = semantic_lookup(semantic_cache, prompt, context)
+            if cached is not None:
+                LOGGER.info("Semantic cache hit; skipping inference")
+                return as_cache_hit(cached, time.perf_counter() - started)
+
+    response = _route_classified(
+        prompt,
+        route=classification["route"],
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        enable_realtime_apis=enable_realtime_apis,
+        auto_escalate=auto_escalate,
+        notify=notify,
+        local_profile=active_local_profile,
+        cloud_profile=active_cloud_profile,
+        hedge_after_s=hedge_after_s,
+    )
+
+    # Don't keep answers where local admitted uncertainty and escalation failed
+    if (exact_key is not None or semantic_cache is not None) and not (
+        isinstance(response, LocalModelResponse) and response_shows_uncertainty(response)
+    ):
+        if exact_key is not None:
+            EXACT_CACHE.put(exact_key, response)
+        if semantic_cache is not None and embedding is not None:
+            semantic_insert(semantic_cache, embedding, context, response)
+    return response
+
+
+def _route_classified(
+    prompt: str,
+    *,
+    route: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    enable_realtime_apis: bool,
+    auto_escalate: bool,
+    notify: Optional[Callable[[str], None]],
+    local_profile: LocalProfile,
+    cloud_profile: CloudProfile,
+    hedge_after_s: Optional[float],
+) -> Union[LocalModelResponse, CloudModelResponse]:
+    """Run the pre-classified prompt on cloud, or local with post-routing checks."""
+
+    needs_realtime_data = route == "API_CHECK"
+
     # Route to cloud if obviously too complex for local model
-    if classification["route"] == "CLOUD":
+    if route == "CLOUD":
         LOGGER.info("Pre-routing to cloud (complexity heuristic)")
-        if on_status_change:
-            on_status_change("cloud_processing")
+        if notify is not None:
+            notify("cloud_processing")
         return _call_cloud(
             prompt,
             system_prompt=system_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
-            cloud_profile=active_cloud_profile,
+            cloud_profile=cloud_profile,
         )
 
     # Try local model (energy-efficient default)
     LOGGER.info("Routing to local model (energy-saving mode)")
-    if on_status_change:
-        on_status_change("local_starting")
+    if notify is not None:
+        notify("local_starting")
+    run_local = partial(
+        _run_local,
+        prompt,
+        needs_realtime_data=needs_realtime_data,
+        enable_realtime_apis=enable_realtime_apis,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        local_profile=local_profile,
+        cloud_profile=cloud_profile,
+        notify=notify,
+    )
+    run_cloud = partial(
+        _call_cloud,
+        prompt,
+        system_prompt=system_prompt,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        cloud_profile=cloud_profile,
+    )
     try:
-        # Only use API pipeline if realtime data is actually needed
-        if needs_realtime_data and enable_realtime_apis:
-            LOGGER.info("Real-time data required; augmenting via API pipeline")
-            if on_status_change:
-                on_status_change("api_fetching")
-            local_response = run_api_check(
-                prompt,
-                system_prompt=system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+        if hedge_after_s is None:
+            local_response = run_local()
         else:
-            if needs_realtime_data and not enable_realtime_apis:
-                LOGGER.info("Real-time data needed but APIs disabled; using local knowledge only")
-
-            # Build optimized prompt with anti-hallucination instructions
-            optimized_prompt = build_local_prompt(
-                user_query=prompt,
-                allow_richer_context=False,  # Force brief answers to reduce hallucination
+            response, hedged = _hedged_dispatch(
+                run_local,
+                run_cloud,
+                hedge_after_s=hedge_after_s,
+                accept_local=lambda local: not (
+                    auto_escalate and response_shows_uncertainty(local)
+                ),
+                notify=notify,
             )
-
-            # Use SEVEN Local identity as system prompt if none provided
-            final_system_prompt = system_prompt if system_prompt else get_system_prompt_local()
-
-            local_response = ask_local(
-                optimized_prompt,
-                system_prompt=final_system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
-
-        _annotate_local_energy(
-            local_response,
-            local_profile=active_local_profile,
-            cloud_profile=active_cloud_profile,
-        )
+            if hedged:
+                return response
+            local_response = response
 
         # Post-routing validation (zero cost)
         if auto_escalate and response_shows_uncertainty(local_response):
             LOGGER.info("Local response shows uncertainty, escalating to cloud")
-            if on_status_change:
-                on_status_change("local_uncertain_escalating")
-                on_status_change("cloud_processing")
+            if notify is not None:
+                notify("local_uncertain_escalating")
+                notify("cloud_processing")
             try:
-                return _call_cloud(
-                    prompt,
-                    system_prompt=system_prompt,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    cloud_profile=active_cloud_profile,
-                )
-            except CloudModelError as cloud_exc:
+                return run_cloud()
+            except _cloud_module().CloudModelError as cloud_exc:
                 LOGGER.warning(
                     "Cloud escalation failed (%s), returning local response anyway",
                     cloud_exc,
@@ -209,46 +303,207 @@ def route_prompt(
 
     except LemonadeClientError as exc:
         LOGGER.warning("Local model failed (%s). Falling back to cloud.", exc)
+        cloud_error = _cloud_module().CloudModelError
         try:
-            return _call_cloud(
-                prompt,
-                system_prompt=system_prompt,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                cloud_profile=active_cloud_profile,
-            )
-        except CloudModelError as cloud_exc:
-            raise CloudModelError(
+            return run_cloud()
+        except cloud_error as cloud_exc:
+            raise cloud_error(
                 f"All backends failed. Local: {exc}, Cloud: {cloud_exc}"
             ) from cloud_exc
 
 
-if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+async def aroute_prompt(
+    prompt: str, **route_kwargs: Any
+) -> Union[LocalModelResponse, CloudModelResponse]:
+    """Route a prompt without blocking the running event loop.
 
-    if len(sys.argv) < 2:
-        print('Usage: python router.py "your prompt here"')
-        print('       python router.py "your prompt" --cloud  # Force cloud')
-        sys.exit(1)
+    The backends are blocking HTTP clients, so route_prompt runs in a worker
+    thread and the loop stays free (e.g. to keep a UI responsive) meanwhile.
 
-    # Parse arguments
-    args = sys.argv[1:]
-    force_cloud = "--cloud" in args
-    if force_cloud:
-        args.remove("--cloud")
+    Args:
+        prompt: User prompt to execute.
+        **route_kwargs: Keyword arguments forwarded to route_prompt.
 
-    test_prompt = " ".join(args)
+    Returns:
+        The same response route_prompt would return.
+
+    Raises:
+        ValueError: If prompt is empty.
+        CloudModelError: If cloud-only mode fails or all backends fail.
+    """
+    return await asyncio.to_thread(route_prompt, prompt, **route_kwargs)
+
+
+def route_prompts(
+    prompts: Sequence[str],
+    *,
+    max_workers: int = 4,
+    **route_kwargs: Any,
+) -> List[Union[LocalModelResponse, CloudModelResponse]]:
+    """Route several prompts concurrently and return responses in input order.
+
+    Each prompt goes through the same pre/post-routing as route_prompt, but the
+    backend calls overlap so Lemonade Server and the cloud API can serve them
+    together instead of one round-trip at a time.
+
+    Args:
+        prompts: User prompts to execute.
+        max_workers: Maximum number of prompts routed at the same time.
+        **route_kwargs: Keyword arguments forwarded to route_prompt for every prompt.
+
+    Returns:
+        One LocalModelResponse or CloudModelResponse per prompt, in the same order.
+
+    Raises:
+        ValueError: If any prompt is empty.
+        CloudModelError: If every backend fails for one of the prompts.
+    """
+    if not prompts:
+        return []
 
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prompts)))) as pool:
+        return list(pool.map(lambda prompt: route_prompt(prompt, **route_kwargs), prompts))
+
+
+def _run_local(
+    prompt: str,
+    *,
+    needs_realtime_data: bool,
+    enable_realtime_apis: bool,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    local_profile: LocalProfile,
+    cloud_profile: CloudProfile,
+    notify: Optional[Callable[[str], None]],
+) -> LocalModelResponse:
+    """Answer on the local model, via the API pipeline when real-time data is needed."""
+
+    # Only use API pipeline if realtime data is actually needed
+    if needs_realtime_data and enable_realtime_apis:
+        LOGGER.info("Real-time data required; augmenting via API pipeline")
+        if notify is not None:
+            notify("api_fetching")
+        local_response = _api_check_module().run_api_check(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+    else:
+        if needs_realtime_data and not enable_realtime_apis:
+            LOGGER.info("Real-time data needed but APIs disabled; using local knowledge only")
+
+        # Build optimized prompt with anti-hallucination instructions
+        optimized_prompt = build_local_prompt(
+            user_query=prompt,
+            allow_richer_context=False,  # Force brief answers to reduce hallucination
+        )
+
+        # Use SEVEN Local identity as system prompt if none provided
+        final_system_prompt = system_prompt if system_prompt else get_system_prompt_local()
+
+        local_response = ask_local(
+            optimized_prompt,
+            system_prompt=final_system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    _annotate_local_energy(
+        local_response,
+        local_profile=local_profile,
+        cloud_profile=cloud_profile,
+    )
+    return local_response
+
+
+def _hedged_dispatch(
+    run_local: Callable[[], LocalModelResponse],
+    run_cloud: Callable[[], CloudModelResponse],
+    *,
+    hedge_after_s: float,
+    accept_local: Callable[[LocalModelResponse], bool],
+    notify: Optional[Callable[[str], None]],
+) -> Tuple[Union[LocalModelResponse, CloudModelResponse], bool]:
+    """Race the local path against a cloud call started after a stagger.
+
+    Returns:
+        (response, hedged). When local settles within hedge_after_s its result is
+        returned (or its error raised) with hedged=False so the caller applies the
+        usual post-routing rules. Otherwise the first acceptable response wins with
+        hedged=True; a usable-but-uncertain local answer is kept only if cloud fails.
+
+    Raises:
+        LemonadeClientError: If local fails before the cloud call is started.
+        CloudModelError: If both backends fail once hedging has started.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=2)
     try:
-        result = route_prompt(test_prompt, use_cloud=force_cloud)
-        print("\n=== SEVEN Router ===")
-        print(f"Model:   {result.model}")
-        print(f"Latency: {result.latency_s:.2f}s")
-        print(f"Tokens:  {result.tokens_used if result.tokens_used else 'N/A'}")
-        print(f"\nResponse:\n{result.text}")
-    except Exception as exc:  # pylint: disable=broad-except
-        print(f"Routing failed: {exc}")
-        sys.exit(1)
+        local_future = executor.submit(run_local)
+        done, _ = wait([local_future], timeout=hedge_after_s)
+        if done:
+            return local_future.result(), False
+
+        LOGGER.info("Local model still running after %.1fs; hedging with cloud", hedge_after_s)
+        if notify is not None:
+            notify("cloud_processing")
+        cloud_future = executor.submit(run_cloud)
+
+        fallback_local: Optional[LocalModelResponse] = None
+        local_exc: Optional[BaseException] = None
+        cloud_exc: Optional[BaseException] = None
+        pending = {local_future, cloud_future}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if local_future in done:
+                local_exc = local_future.exception()
+                if local_exc is None:
+                    local_response = local_future.result()
+                    if accept_local(local_response):
+                        return local_response, True
+                    fallback_local = local_response
+            if cloud_future in done:
+                cloud_exc = cloud_future.exception()
+                if cloud_exc is None:
+                    return cloud_future.result(), True
+
+        if fallback_local is not None:
+            LOGGER.warning(
+                "Cloud hedge failed (%s), returning local response anyway", cloud_exc
+            )
+            return fallback_local, True
+        cloud_error = _cloud_module().CloudModelError
+        raise cloud_error(
+            f"All backends failed. Local: {local_exc}, Cloud: {cloud_exc}"
+        ) from cloud_exc
+    finally:
+        # The slower call cannot be interrupted mid-request; let it finish in the
+        # background and discard its result.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@cache
+def _cloud_module() -> ModuleType:
+    """Import the cloud client on first use so local-only runs skip the SDK."""
+
+    try:
+        from . import cloud_model
+    except ImportError:
+        import cloud_model
+    return cloud_model
+
+
+@cache
+def _api_check_module() -> ModuleType:
+    """Import the real-time API pipeline only when a prompt needs it."""
+
+    try:
+        from . import api_check
+    except ImportError:
+        import api_check
+    return api_check
 
 
 def _call_cloud(
@@ -261,7 +516,7 @@ def _call_cloud(
 ) -> CloudModelResponse:
     """Invoke the cloud backend and append energy metadata."""
 
-    response = ask_cloud(
+    response = _cloud_module().ask_cloud(
         prompt,
         system_prompt=system_prompt,
         temperature=temperature,
@@ -313,3 +568,34 @@ def _attach_cloud_energy(
         )
     except Exception as exc:  # pragma: no cover - best-effort metadata
         LOGGER.warning("Cloud energy annotation failed: %s", exc)
+
+
+__all__ = ["aroute_prompt", "route_prompt", "route_prompts"]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    if len(sys.argv) < 2:
+        print('Usage: python router.py "your prompt here"')
+        print('       python router.py "your prompt" --cloud  # Force cloud')
+        sys.exit(1)
+
+    # Parse arguments
+    args = sys.argv[1:]
+    force_cloud = "--cloud" in args
+    if force_cloud:
+        args.remove("--cloud")
+
+    test_prompt = " ".join(args)
+
+    try:
+        result = route_prompt(test_prompt, use_cloud=force_cloud)
+        print("\n=== SEVEN Router ===")
+        print(f"Model:   {result.model}")
+        print(f"Latency: {result.latency_s:.2f}s")
+        print(f"Tokens:  {result.tokens_used if result.tokens_used else 'N/A'}")
+        print(f"\nResponse:\n{result.text}")
+    except Exception as exc:  # pylint: disable=broad-except
+        print(f"Routing failed: {exc}")
+        sys.exit(1)
@@ -0,0 +1,145 @@
+# ============================================================
+#  File: semantic_cache.py
+#  Project: SEVEN (Sustainable Energy via Efficient Neural-routing)
+#  Description: Embedding-similarity response cache (optional dependencies).
+#  Author(s): Team SEVEN
+#  Date: 2026-10-15
+# ============================================================
+"""Embedding-similarity response cache for near-duplicate prompts.
+
+Requires numpy and sentence-transformers; import it through
+cache.get_semantic_cache() so installs without them keep working.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_SEMANTIC_MAXSIZE = 1000
+
+_EMBEDDERS: Dict[str, Any] = {}
+_EMBEDDER_LOCK = threading.Lock()
+
+
+def get_embedder(model_name: str = DEFAULT_EMBEDDING_MODEL) -> Any:
+    """Return the process-wide SentenceTransformer, loading its weights only once."""
+    embedder = _EMBEDDERS.get(model_name)
+    if embedder is None:
+        with _EMBEDDER_LOCK:
+            embedder = _EMBEDDERS.get(model_name)
+            if embedder is None:
+                from sentence_transformers import SentenceTransformer
+
+                embedder = SentenceTransformer(model_name)
+                _EMBEDDERS[model_name] = embedder
+    return embedder
+
+
+class SemanticCache:
+    """LRU cache of responses matched by prompt-embedding cosine similarity.
+
+    Embeddings are L2-normalized and stored in one preallocated float32 matrix,
+    so a single matrix-vector product scores every cached prompt. Entries only
+    match when their context digest (system prompt and sampling settings) is
+    identical to the lookup's.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        maxsize: int = DEFAULT_SEMANTIC_MAXSIZE,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+    ) -> None:
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None
+        self._contexts = np.zeros(maxsize, dtype=np.int64)
+        self._responses: List[Any] = []
+        self._recency: OrderedDict[int, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def embed(self, prompt: str) -> np.ndarray:
+        """Return the normalized embedding for a prompt."""
+        embedding = get_embedder(self.model_name).encode(
+            prompt, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return embedding.astype(np.float32, copy=False)
+
+    def lookup(self, embedding: np.ndarray, context: int) -> Optional[Any]:
+        """Return the most similar cached response above the threshold, if any."""
+        with self._lock:
+            size = len(self._responses)
+            if not size:
+                return None
+            scores = self._embeddings[:size] @ embedding
+            scores[self._contexts[:size] != context] = -1.0
+            slot = int(scores.argmax())
+            if scores[slot] < self.threshold:
+                return None
+            self._recency.move_to_end(slot)
+            return self._responses[slot]
+
+    def insert(self, embedding: np.ndarray, context: int, response: Any) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = np.zeros(
+                    (self.maxsize, embedding.shape[0]), dtype=np.float32
+                )
+            if len(self._responses) < self.maxsize:
+                slot = len(self._responses)
+                self._responses.append(response)
+            else:
+                slot, _ = self._recency.popitem(last=False)
+                self._responses[slot] = response
+            self._embeddings[slot] = embedding
+            self._contexts[slot] = context
+            self._recency[slot] = None
+
+    def save(self, path: str) -> None:
+        """Write the cache to an .npz file, oldest entry first."""
+        with self._lock:
+            order = list(self._recency)
+            if not order:
+                return
+            responses = np.empty(len(order), dtype=object)
+            responses[:] = [self._responses[slot] for slot in order]
+            # Through a file object, since np.savez appends ".npz" to bare paths
+            with open(path, "wb") as file:
+                np.savez(
+                    file,
+                    embeddings=self._embeddings[order],
+                    contexts=self._contexts[order],
+                    responses=responses,
+                )
+
+    def load(self, path: str) -> None:
+        """Restore entries saved by save(); the file is trusted (it holds pickles).
+
+        Raises:
+            ValueError: If the stored embeddings don't have the current
+                embedder's dimension (e.g. SEVEN_EMBEDDING_MODEL changed).
+        """
+        with np.load(path, allow_pickle=True) as data:
+            embeddings = data["embeddings"]
+            dimension = get_embedder(self.model_name).get_sentence_embedding_dimension()
+            if dimension is not None and embeddings.shape[1] != dimension:
+                raise ValueError(
+                    f"stored embeddings have dimension {embeddings.shape[1]}, "
+                    f"but {self.model_name} produces {dimension}"
+                )
+            for embedding, context, response in zip(
+                embeddings, data["contexts"], data["responses"]
+            ):
+                self.insert(embedding, int(context), response)
@@ -3,6 +3,7 @@ Elia CLI
 """
 
 import asyncio
+import os
 import pathlib
 from textwrap import dedent
 import tomllib
@@ -16,15 +17,15 @@ from rich.console import Console
 from elia_chat.app import Elia
 from elia_chat.config import LaunchConfig
 from elia_chat.database.import_chatgpt import import_chatgpt_data
-from elia_chat.database.database import create_database, sqlite_file_name
+from elia_chat.database.database import create_database_sync, sqlite_file_name
 from elia_chat.locations import config_file
 
 console = Console()
 
 def create_db_if_not_exists() -> None:
-    if not sqlite_file_name.exists():
+    if not os.path.exists(sqlite_file_name):
         click.echo(f"Creating database at {sqlite_file_name!r}")
-        asyncio.run(create_database())
+        create_database_sync()
 
 def load_or_create_config_file() -> dict[str, Any]:
     config = config_file()
@@ -101,7 +102,7 @@ You may wish to create a backup of \
     )
     if click.confirm("Delete all chats?", abort=True):
         sqlite_file_name.unlink(missing_ok=True)
-        asyncio.run(create_database())
+        create_database_sync()
         console.print(f"♻️  Database reset @ {sqlite_file_name}")
 
 @cli.command("import")
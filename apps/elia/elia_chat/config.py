@@ -1,3 +1,4 @@
+import functools
 import os
 
 from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, SecretStr
@@ -105,5 +106,7 @@ class LaunchConfig(BaseModel):
         return get_model(self.default_model, self)
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_current(cls) -> "LaunchConfig":
+        # Frozen, so one validated instance can be shared for the process
         return cls()
@@ -1,13 +1,15 @@
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from sqlmodel import SQLModel
-from elia_chat.locations import data_directory
+from elia_chat.locations import database_file
 
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 
-sqlite_file_name = data_directory() / "elia.sqlite"
+sqlite_file_name = database_file()
 sqlite_url = f"sqlite+aiosqlite:///{sqlite_file_name}"
 engine = create_async_engine(sqlite_url)
 
@@ -18,6 +20,24 @@ async def create_database():
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+def create_database_sync() -> None:
+    """Create the schema through a short-lived synchronous engine.
+
+    For one-shot startup callers that would otherwise spin up an event loop
+    just to run create_database(). The table models are imported here, so
+    callers never load them unless the schema actually has to be created.
+    """
+    import elia_chat.database.models  # noqa: F401
+
+    # A brand-new file has no tables, so skip the per-table existence queries
+    checkfirst = os.path.exists(sqlite_file_name)
+    sync_engine = create_engine(f"sqlite:///{sqlite_file_name}")
+    try:
+        SQLModel.metadata.create_all(sync_engine, checkfirst=checkfirst)
+    finally:
+        sync_engine.dispose()
+
+
 @asynccontextmanager
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async_session = async_sessionmaker(
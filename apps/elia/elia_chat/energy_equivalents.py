@@ -7,11 +7,12 @@ All conversion factors are based on typical real-world power consumption.
 
 from __future__ import annotations
 
+import heapq
 import random
-from typing import TypedDict
+from typing import Callable, NamedTuple
 
 
-class EnergyEquivalent(TypedDict):
+class EnergyEquivalent(NamedTuple):
     """Structure for a single energy equivalent."""
 
     unit: str
@@ -22,99 +23,111 @@ class EnergyEquivalent(TypedDict):
 
 # Real-world energy equivalents with researched conversion factors
 EQUIVALENTS: list[EnergyEquivalent] = [
-    {
-        "unit": "LED bulb (10W)",
-        "wh_per_unit": 10.0,
-        "format_str": "You've powered a LED bulb for {:.1f} hours",
-        "emoji": "💡",
-    },
-    {
-        "unit": "smartphone charge",
-        "wh_per_unit": 12.0,
-        "format_str": "You've charged a smartphone {:.2f} times",
-        "emoji": "📱",
-    },
-    {
-        "unit": "laptop work (50W)",
-        "wh_per_unit": 50.0,
-        "format_str": "You've powered a laptop for {:.1f} hours",
-        "emoji": "💻",
-    },
-    {
-        "unit": "Wi-Fi router (6W)",
-        "wh_per_unit": 6.0,
-        "format_str": "You've kept Wi-Fi running for {:.1f} hours",
-        "emoji": "📡",
-    },
-    {
-        "unit": "TV streaming (100W)",
-        "wh_per_unit": 100.0,
-        "format_str": "You've streamed TV for {:.1f} hours",
-        "emoji": "📺",
-    },
-    {
-        "unit": "coffee brew (800W for 5min)",
-        "wh_per_unit": 66.7,
-        "format_str": "You've brewed {:.1f} cups of coffee",
-        "emoji": "☕",
-    },
-    {
-        "unit": "microwave heating (1000W)",
-        "wh_per_unit": 16.7,
-        "format_str": "You've microwaved food for {:.0f} minutes",
-        "emoji": "🍲",
-    },
-    {
-        "unit": "electric kettle boil (2000W for 3min)",
-        "wh_per_unit": 100.0,
-        "format_str": "You've boiled water {:.1f} times",
-        "emoji": "🫖",
-    },
-    {
-        "unit": "desktop PC (200W)",
-        "wh_per_unit": 200.0,
-        "format_str": "You've powered a desktop PC for {:.1f} hours",
-        "emoji": "🖥️",
-    },
-    {
-        "unit": "gaming console (150W)",
-        "wh_per_unit": 150.0,
-        "format_str": "You've gamed for {:.1f} hours",
-        "emoji": "🎮",
-    },
-    {
-        "unit": "tablet charge (18Wh)",
-        "wh_per_unit": 18.0,
-        "format_str": "You've charged a tablet {:.2f} times",
-        "emoji": "📱",
-    },
-    {
-        "unit": "room fan (75W)",
-        "wh_per_unit": 75.0,
-        "format_str": "You've run a fan for {:.1f} hours",
-        "emoji": "🌀",
-    },
-    {
-        "unit": "e-bike mile (15Wh/mi)",
-        "wh_per_unit": 15.0,
-        "format_str": "You've e-biked {:.1f} miles",
-        "emoji": "🚴",
-    },
-    {
-        "unit": "EV mile (300Wh/mi)",
-        "wh_per_unit": 300.0,
-        "format_str": "You've offset {:.2f} miles of EV driving",
-        "emoji": "🚗",
-    },
-    {
-        "unit": "CO₂ (0.4 kg/kWh grid avg)",
-        "wh_per_unit": 2500.0,
-        "format_str": "You've prevented {:.1f}g of CO₂",
-        "emoji": "🌍",
-    },
+    EnergyEquivalent(
+        unit="LED bulb (10W)",
+        wh_per_unit=10.0,
+        format_str="You've powered a LED bulb for {:.1f} hours",
+        emoji="💡",
+    ),
+    EnergyEquivalent(
+        unit="smartphone charge",
+        wh_per_unit=12.0,
+        format_str="You've charged a smartphone {:.2f} times",
+        emoji="📱",
+    ),
+    EnergyEquivalent(
+        unit="laptop work (50W)",
+        wh_per_unit=50.0,
+        format_str="You've powered a laptop for {:.1f} hours",
+        emoji="💻",
+    ),
+    EnergyEquivalent(
+        unit="Wi-Fi router (6W)",
+        wh_per_unit=6.0,
+        format_str="You've kept Wi-Fi running for {:.1f} hours",
+        emoji="📡",
+    ),
+    EnergyEquivalent(
+        unit="TV streaming (100W)",
+        wh_per_unit=100.0,
+        format_str="You've streamed TV for {:.1f} hours",
+        emoji="📺",
+    ),
+    EnergyEquivalent(
+        unit="coffee brew (800W for 5min)",
+        wh_per_unit=66.7,
+        format_str="You've brewed {:.1f} cups of coffee",
+        emoji="☕",
+    ),
+    EnergyEquivalent(
+        unit="microwave heating (1000W)",
+        wh_per_unit=16.7,
+        format_str="You've microwaved food for {:.0f} minutes",
+        emoji="🍲",
+    ),
+    EnergyEquivalent(
+        unit="electric kettle boil (2000W for 3min)",
+        wh_per_unit=100.0,
+        format_str="You've boiled water {:.1f} times",
+        emoji="🫖",
+    ),
+    EnergyEquivalent(
+        unit="desktop PC (200W)",
+        wh_per_unit=200.0,
+        format_str="You've powered a desktop PC for {:.1f} hours",
+        emoji="🖥️",
+    ),
+    EnergyEquivalent(
+        unit="gaming console (150W)",
+        wh_per_unit=150.0,
+        format_str="You've gamed for {:.1f} hours",
+        emoji="🎮",
+    ),
+    EnergyEquivalent(
+        unit="tablet charge (18Wh)",
+        wh_per_unit=18.0,
+        format_str="You've charged a tablet {:.2f} times",
+        emoji="📱",
+    ),
+    EnergyEquivalent(
+        unit="room fan (75W)",
+        wh_per_unit=75.0,
+        format_str="You've run a fan for {:.1f} hours",
+        emoji="🌀",
+    ),
+    EnergyEquivalent(
+        unit="e-bike mile (15Wh/mi)",
+        wh_per_unit=15.0,
+        format_str="You've e-biked {:.1f} miles",
+        emoji="🚴",
+    ),
+    EnergyEquivalent(
+        unit="EV mile (300Wh/mi)",
+        wh_per_unit=300.0,
+        format_str="You've offset {:.2f} miles of EV driving",
+        emoji="🚗",
+    ),
+    EnergyEquivalent(
+        unit="CO₂ (0.4 kg/kWh grid avg)",
+        wh_per_unit=2500.0,
+        format_str="You've prevented {:.1f}g of CO₂",
+        emoji="🌍",
+    ),
 ]
 
 
+# Column-wise copies of EQUIVALENTS so lookups index flat tuples, not records
+_WH_PER_UNIT: tuple[float, ...] = tuple(eq.wh_per_unit for eq in EQUIVALENTS)
+_FORMAT_STRS: tuple[str, ...] = tuple(eq.format_str for eq in EQUIVALENTS)
+_EMOJIS: tuple[str, ...] = tuple(eq.emoji for eq in EQUIVALENTS)
+
+# Bound once so each pick skips the global-random and attribute lookups
+_RANDRANGE = random.Random().randrange
+_EQUIVALENT_COUNT = len(_WH_PER_UNIT)
+
+_NO_SAVINGS_MESSAGE = "Start chatting to make an impact!"
+
+
 def random_equivalent(saved_wh: float) -> str:
     """Convert saved watt-hours into a random real-world equivalent.
 
@@ -133,23 +146,75 @@ def random_equivalent(saved_wh: float) -> str:
         >>> random_equivalent(0.0)
         'Start chatting to make an impact!'
     """
+    # Pick a random equivalent
+    return describe_equivalent(random_equivalent_index(), saved_wh)
+
+
+def random_equivalent_index() -> int:
+    """Pick a random index into EQUIVALENTS, for callers that keep their choice."""
+    return _RANDRANGE(_EQUIVALENT_COUNT)
+
+
+def describe_equivalent(index: int, saved_wh: float) -> str:
+    """Convert saved watt-hours using the equivalent at a given EQUIVALENTS index.
+
+    Args:
+        index: Position of the equivalent in EQUIVALENTS.
+        saved_wh: Total watt-hours saved through intelligent routing.
+
+    Returns:
+        The same wording random_equivalent produces for that equivalent.
+    """
     if saved_wh <= 0:
-        return "Start chatting to make an impact!"
+        return _NO_SAVINGS_MESSAGE
+    return _format_equivalent(index, saved_wh)
+
+
+def top_k_equivalents(saved_wh: float, k: int = 3) -> list[str]:
+    """Describe savings with the k equivalents closest to a single whole unit.
+
+    Args:
+        saved_wh: Total watt-hours saved through intelligent routing.
+        k: Maximum number of equivalents to return.
+
+    Returns:
+        Formatted equivalents, best fit first, or the fallback message if
+        saved_wh is zero or negative.
+    """
+    if saved_wh <= 0:
+        return [_NO_SAVINGS_MESSAGE]
+
+    best = heapq.nsmallest(
+        k,
+        range(_EQUIVALENT_COUNT),
+        key=lambda index: abs(saved_wh / _WH_PER_UNIT[index] - 1.0),
+    )
+    return [_format_equivalent(index, saved_wh) for index in best]
 
-    # Pick a random equivalent
-    eq = random.choice(EQUIVALENTS)
 
+def _format_equivalent(index: int, saved_wh: float) -> str:
+    """Format saved_wh using the equivalent at index."""
     # Calculate the value
-    value = saved_wh / eq["wh_per_unit"]
+    value = saved_wh / _WH_PER_UNIT[index]
 
-    # Format based on the conversion factor
-    # Use custom formatting for very small or very large values
-    if value < 0.01:
-        return f"{eq['emoji']} You've saved just a few seconds worth"
-    elif value > 1000:
-        return f"{eq['emoji']} You've made a HUGE impact!"
-    else:
-        return f"{eq['emoji']} {eq['format_str'].format(value)}"
+    # Use custom wording for very small or very large values
+    bucket = (value < 0.01) + 2 * (value > 1000)
+    return f"{_EMOJIS[index]} {_BUCKET_FORMATTERS[bucket](index, value)}"
 
 
-__all__ = ["random_equivalent", "EQUIVALENTS", "EnergyEquivalent"]
+# Indexed by (value < 0.01) + 2 * (value > 1000): in range, tiny, huge
+_BUCKET_FORMATTERS: tuple[Callable[[int, float], str], ...] = (
+    lambda index, value: _FORMAT_STRS[index].format(value),
+    lambda index, value: "You've saved just a few seconds worth",
+    lambda index, value: "You've made a HUGE impact!",
+)
+
+
+__all__ = [
+    "describe_equivalent",
+    "random_equivalent",
+    "random_equivalent_index",
+    "top_k_equivalents",
+    "EQUIVALENTS",
+    "EnergyEquivalent",
+]
@@ -1,9 +1,13 @@
+from functools import lru_cache
 from pathlib import Path
 
 from xdg_base_dirs import xdg_config_home, xdg_data_home
 
 
+@lru_cache(maxsize=None)
 def _elia_directory(root: Path) -> Path:
+    # Memoized: the mkdir probe runs once per directory per process, however
+    # many startup paths (database, config, themes) ask for it
     directory = root / "elia"
     directory.mkdir(exist_ok=True, parents=True)
     return directory
@@ -14,6 +18,11 @@ def data_directory() -> Path:
     return _elia_directory(xdg_data_home())
 
 
+def database_file() -> Path:
+    """Return the path of the SQLite chat database (the file may not exist yet)."""
+    return data_directory() / "elia.sqlite"
+
+
 def config_directory() -> Path:
     """Return (possibly creating) the application config directory."""
     return _elia_directory(xdg_config_home())
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from rich.markup import escape
+
+
+@lru_cache(maxsize=128)
+def escape_markup(text: str) -> str:
+    """rich.markup.escape, cached since titles and model names repeat across updates.
+
+    Rich only escapes brackets that look like tags, so a plain character
+    translation table would change the rendered text; caching keeps it exact.
+    """
+    return escape(text)
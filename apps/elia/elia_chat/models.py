@@ -23,13 +23,15 @@ def get_model(
 
     if config is None:
         config = active_app.get().launch_config
-    try:
-        return {model.id: model for model in config.all_models}[model_id_or_name]
-    except KeyError:
-        try:
-            return {model.name: model for model in config.all_models}[model_id_or_name]
-        except KeyError:
-            pass
+    models = config.all_models
+    # Scan from the end so a later definition wins, as it would in a dict
+    # built from the list, and stop at the first match
+    for model in reversed(models):
+        if model.id == model_id_or_name:
+            return model
+    for model in reversed(models):
+        if model.name == model_id_or_name:
+            return model
     return UnknownModel(id="unknown", name="unknown model")
 
 
@@ -9,19 +9,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Optional, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence
 
-from SEVEN.cloud_model import CloudModelResponse
+from SEVEN.cache import DETERMINISTIC_MAX_TEMPERATURE, preload_semantic_cache
 from SEVEN.local_model import LocalModelResponse
 from SEVEN.router import route_prompt
 
 from elia_chat.models import ChatMessage
 from elia_chat.runtime_config import RuntimeConfig
 
+if TYPE_CHECKING:
+    from SEVEN.cloud_model import CloudModelResponse
 
-@dataclass
+# Messages searched backwards for the latest user prompt
+_LATEST_PROMPT_SCAN_LIMIT = 64
+
+# route_prompt arguments that, with the prompt, identify a coalescable request
+_COALESCE_KEY_FIELDS = (
+    "system_prompt",
+    "temperature",
+    "local_energy_profile",
+    "cloud_energy_profile",
+)
+_IN_FLIGHT: dict[tuple[Any, ...], Future] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# Load the embedding model while the UI starts so the first prompt doesn't wait on it
+preload_semantic_cache()
+
+
+@dataclass(slots=True)
 class SevenRouteResult:
     """Structured response returned to Elia after routing through SEVEN."""
 
@@ -50,11 +73,70 @@ def call_seven_router(
         runtime_config: Model configuration and system prompt.
         on_status_change: Optional callback for routing status updates.
     """
+    prompt_text, route_kwargs = _router_request(messages, runtime_config, on_status_change)
+    return _to_route_result(_route_coalesced(prompt_text, route_kwargs))
+
+
+async def acall_seven_router(
+    messages: Sequence[ChatMessage],
+    runtime_config: RuntimeConfig,
+    on_status_change: Optional[Callable[[str], None]] = None,
+) -> SevenRouteResult:
+    """Async variant of call_seven_router that keeps the event loop free.
+
+    on_status_change is invoked from the routing worker thread.
+    """
+    prompt_text, route_kwargs = _router_request(messages, runtime_config, on_status_change)
+    return _to_route_result(
+        await asyncio.to_thread(_route_coalesced, prompt_text, route_kwargs)
+    )
+
+
+def _route_coalesced(
+    prompt_text: str, route_kwargs: dict[str, Any]
+) -> LocalModelResponse | CloudModelResponse:
+    """Route a prompt, sharing one backend call among identical concurrent requests.
+
+    Only deterministic requests are coalesced, matching SEVEN's exact cache:
+    a caller that arrives while the same request is in flight waits for that
+    call instead of sending its own. Waiting callers get no status updates.
+    """
+    if route_kwargs["temperature"] > DETERMINISTIC_MAX_TEMPERATURE:
+        return route_prompt(prompt_text, **route_kwargs)
+
+    key = (prompt_text, *(route_kwargs[name] for name in _COALESCE_KEY_FIELDS))
+    with _IN_FLIGHT_LOCK:
+        pending = _IN_FLIGHT.get(key)
+        is_leader = pending is None
+        if is_leader:
+            pending = _IN_FLIGHT[key] = Future()
+    if not is_leader:
+        return pending.result()
+
+    try:
+        result = route_prompt(prompt_text, **route_kwargs)
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        pending.set_result(result)
+        return result
+    finally:
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT[key]
+
+
+def _router_request(
+    messages: Sequence[ChatMessage],
+    runtime_config: RuntimeConfig,
+    on_status_change: Optional[Callable[[str], None]],
+) -> tuple[str, dict[str, Any]]:
+    """Build the prompt and route_prompt keyword arguments for a chat history."""
     prompt_text = _latest_user_prompt(messages)
     if not prompt_text:
         raise ValueError("No user prompt available for SEVEN routing.")
 
-    context_block = _conversation_context(messages[:-1])
+    context_block = _format_context(_conversation_context(messages[:-1]))
     system_prompt = (runtime_config.system_prompt or "").strip()
     if context_block:
         formatted_context = (
@@ -68,15 +150,17 @@ def call_seven_router(
             else formatted_context
         )
 
-    result = route_prompt(
-        prompt_text,
-        system_prompt=system_prompt or None,
-        temperature=runtime_config.selected_model.temperature,
-        on_status_change=on_status_change,
-        local_energy_profile=runtime_config.local_profile,
-        cloud_energy_profile=runtime_config.cloud_profile,
-    )
+    return prompt_text, {
+        "system_prompt": system_prompt or None,
+        "temperature": runtime_config.selected_model.temperature,
+        "on_status_change": on_status_change,
+        "local_energy_profile": runtime_config.local_profile,
+        "cloud_energy_profile": runtime_config.cloud_profile,
+    }
+
 
+def _to_route_result(result: LocalModelResponse | CloudModelResponse) -> SevenRouteResult:
+    """Convert a router response into the structure Elia renders."""
     route = "local" if isinstance(result, LocalModelResponse) else "cloud"
     label = _format_source_label(route, result)
     energy = getattr(result, "energy", None)
@@ -97,16 +181,23 @@ def call_seven_router(
 
 
 def _latest_user_prompt(messages: Sequence[ChatMessage]) -> str:
-    """Return the text content for the most recent user message."""
-    for message in reversed(messages):
-        if message.message.get("role") == "user":
-            return _extract_text(message.message.get("content"))
+    """Return the text content for the most recent user message.
+
+    Only the last _LATEST_PROMPT_SCAN_LIMIT messages are checked, so a history
+    without a recent user turn can't force a scan of the whole conversation.
+    """
+    for chat_message in islice(reversed(messages), _LATEST_PROMPT_SCAN_LIMIT):
+        message = chat_message.message
+        if message.get("role") == "user":
+            return _extract_text(message.get("content"))
     return ""
 
 
-def _conversation_context(messages: Sequence[ChatMessage], limit: int = 6) -> str:
-    """Format a rolling window of prior exchanges into a plain-text context."""
-    lines: list[str] = []
+def _conversation_context(
+    messages: Sequence[ChatMessage], limit: int = 6
+) -> list[tuple[str, str]]:
+    """Collect a rolling window of prior exchanges as (role, text) pairs."""
+    items: list[tuple[str, str]] = []
     for chat_message in messages[-limit:]:
         role = chat_message.message.get("role")
         if role not in {"user", "assistant"}:
@@ -114,27 +205,46 @@ def _conversation_context(messages: Sequence[ChatMessage], limit: int = 6) -> st
         text = _extract_text(chat_message.message.get("content"))
         if not text:
             continue
-        prefix = "User" if role == "user" else "SEVEN"
-        lines.append(f"{prefix}: {text.strip()}")
-    return "\n".join(lines)
+        items.append((role, text.strip()))
+    return items
+
+
+def _format_context(items: Iterable[tuple[str, str]]) -> str:
+    """Format (role, text) pairs into a plain-text context block."""
+    return "\n".join(
+        f"{'User' if role == 'user' else 'SEVEN'}: {text}" for role, text in items
+    )
 
 
 def _extract_text(content: Any) -> str:
     """Normalize Litellm message content into a string."""
-    if isinstance(content, str):
-        return content
+    return _TEXT_EXTRACTORS.get(type(content), _extract_other)(content)
+
+
+def _extract_from_blocks(content: list[Any]) -> str:
+    """Join the text of every dict content block that carries some."""
+    return "\n".join(
+        str(text)
+        for block in content
+        if isinstance(block, dict) and (text := block.get("text"))
+    )
+
+
+def _extract_other(content: Any) -> str:
+    """Handle content types without an exact dispatch entry (e.g. subclasses)."""
     if isinstance(content, list):
-        parts: list[str] = []
-        for block in content:
-            text = block.get("text") if isinstance(block, dict) else None
-            if text:
-                parts.append(str(text))
-        return "\n".join(parts)
-    if content is None:
-        return ""
+        return _extract_from_blocks(content)
     return str(content)
 
 
+# Exact-type dispatch for the common content shapes; anything else falls back
+_TEXT_EXTRACTORS: dict[type, Callable[[Any], str]] = {
+    str: str.__str__,
+    list: _extract_from_blocks,
+    type(None): lambda _content: "",
+}
+
+
 def _format_source_label(route: str, response: LocalModelResponse | CloudModelResponse) -> str:
     """Return a concise label with route and energy context."""
 
@@ -155,14 +265,10 @@ def _format_energy_phrase(
         return None
 
     used_mwh = estimate.watt_hours * 1000.0
-    parts = [f"Used {used_mwh:.1f} mWh"]
-
     savings = getattr(response, "energy_savings_wh", None)
     if route == "local" and savings is not None:
-        saved_mwh = savings * 1000.0
-        parts.append(f"Saved {saved_mwh:.1f} mWh")
-
-    return " · ".join(parts)
+        return f"Used {used_mwh:.1f} mWh · Saved {savings * 1000.0:.1f} mWh"
+    return f"Used {used_mwh:.1f} mWh"
 
 
-__all__ = ["call_seven_router", "SevenRouteResult"]
+__all__ = ["acall_seven_router", "call_seven_router", "SevenRouteResult"]
@@ -1,16 +1,33 @@
+from enum import IntEnum
+
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.reactive import Reactive, reactive
 from textual.widgets import LoadingIndicator, Label
 
 
-# Map routing status codes to user-friendly messages
-STATUS_MESSAGES = {
-    "local_starting": "SEVEN Local is working...",
-    "api_fetching": "Fetching real-time data...",
-    "local_uncertain_escalating": "Escalating to cloud due to uncertainty...",
-    "cloud_processing": "SEVEN Cloud is processing...",
-}
+class RouteStatus(IntEnum):
+    """SEVEN routing stages, doubling as indexes into _STATUS_TEXT."""
+
+    LOCAL_STARTING = 0
+    API_FETCHING = 1
+    LOCAL_UNCERTAIN_ESCALATING = 2
+    CLOUD_PROCESSING = 3
+
+
+# User-friendly message for each RouteStatus, in enum order
+_STATUS_TEXT = (
+    "SEVEN Local is working...",
+    "Fetching real-time data...",
+    "Escalating to cloud due to uncertainty...",
+    "SEVEN Cloud is processing...",
+)
+
+# The router reports string codes; map them onto RouteStatus
+_STATUS_BY_CODE = {status.name.lower(): status for status in RouteStatus}
+
+# Map routing status codes to user-friendly messages (kept for compatibility)
+STATUS_MESSAGES = {code: _STATUS_TEXT[status] for code, status in _STATUS_BY_CODE.items()}
 
 
 class ResponseStatus(Vertical):
@@ -34,8 +51,10 @@ class ResponseStatus(Vertical):
         self.add_class("-agent-responding")
         self.remove_class("-awaiting-response")
 
-    def set_status(self, status_code: str) -> None:
+    def set_status(self, status_code: RouteStatus | str) -> None:
         """Update status message based on SEVEN routing status code."""
-        self.message = STATUS_MESSAGES.get(status_code, "Processing...")
+        if not isinstance(status_code, RouteStatus):
+            status_code = _STATUS_BY_CODE.get(status_code)
+        self.message = "Processing..." if status_code is None else _STATUS_TEXT[status_code]
         self.add_class("-agent-responding")
         self.remove_class("-awaiting-response")
@@ -1,6 +1,5 @@
+import functools
 from typing import TYPE_CHECKING, cast
-from importlib.metadata import version, PackageNotFoundError
-from rich.markup import escape
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.signal import Signal
@@ -8,14 +7,15 @@ from textual.widget import Widget
 from textual.widgets import Label, Static
 
 from rich.text import Text
-from pyfiglet import Figlet
 from elia_chat.config import EliaChatModel
-from elia_chat.models import get_model
+from elia_chat.markup import escape_markup
 from elia_chat.runtime_config import RuntimeConfig
 
 
 def _get_version() -> str:
     """Get the version of elia_chat, with fallback if not installed."""
+    from importlib.metadata import version, PackageNotFoundError
+
     try:
         return version("elia_chat")
     except PackageNotFoundError:
@@ -23,15 +23,20 @@ def _get_version() -> str:
         return "1.10.0-dev"
 
 
+@functools.lru_cache(maxsize=1)
 def _create_project_seven_logo() -> Text:
     """Generate PROJECT SEVEN ASCII logo with gradient.
 
     Creates a multi-line ASCII art logo using pyfiglet with a purple-to-cyan
-    gradient inspired by the cli.py design.
+    gradient inspired by the cli.py design. The logo never changes, so it is
+    rendered once and the same Text is shared by every header.
 
     Returns:
         Rich Text object with gradient-styled ASCII art.
     """
+    # Imported here so pyfiglet loads only when a header is first rendered
+    from pyfiglet import Figlet
+
     fig = Figlet(font='banner3-D')
     ascii_art = fig.renderText('PROJECT SEVEN')
 
@@ -43,19 +48,21 @@ def _create_project_seven_logo() -> Text:
     end_color = (0, 234, 255)    # #00eaff
 
     # Count non-empty lines for gradient calculation
-    non_empty_lines = [line for line in lines if line.strip()]
-    num_lines = len(non_empty_lines)
+    num_lines = sum(1 for line in lines if line.strip())
+    steps = max(num_lines - 1, 1)
+
+    # Precompute one style per non-empty line, top to bottom
+    styles = iter([
+        'rgb({},{},{})'.format(*(
+            int(start + (end - start) * (line_index / steps))
+            for start, end in zip(start_color, end_color)
+        ))
+        for line_index in range(num_lines)
+    ])
 
-    line_index = 0
     for line in lines:
         if line.strip():
-            # Calculate gradient ratio for this line
-            ratio = line_index / max(num_lines - 1, 1)
-            r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-            g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-            b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-            text.append(line + '\n', style=f'rgb({r},{g},{b})')
-            line_index += 1
+            text.append(line + '\n', style=next(styles))
         else:
             text.append('\n')
 
@@ -91,17 +98,12 @@ class AppHeader(Widget):
         with Horizontal():
             with Vertical(id="cl-header-container"):
                 yield Static(_create_project_seven_logo(), id="elia-title")
-            model_name_or_id = (
-                self.elia.runtime_config.selected_model.id
-                or self.elia.runtime_config.selected_model.name
-            )
-            model = get_model(model_name_or_id, self.elia.launch_config)
+            model = self.elia.runtime_config.selected_model
             yield Label(self._get_selected_model_link_text(model), id="model-label")
 
     def _get_selected_model_link_text(self, model: EliaChatModel) -> str:
-        return f"[@click=screen.options]{escape(model.display_name or model.name)}[/]"
+        return f"[@click=screen.options]{escape_markup(model.display_name or model.name)}[/]"
 
     def _update_selected_model(self, model: EliaChatModel) -> None:
-        print(self.elia.runtime_config)
         model_label = self.query_one("#model-label", Label)
         model_label.update(self._get_selected_model_link_text(model))
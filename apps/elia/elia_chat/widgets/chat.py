@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import datetime
+import asyncio
+import time
+from datetime import datetime, timezone
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast
 
-from textual.widgets import Label
-
 from textual import log, on, work, events
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -19,7 +19,7 @@ from elia_chat import constants
 from elia_chat.chats_manager import ChatsManager
 from elia_chat.models import ChatData, ChatMessage
 from elia_chat.screens.chat_details import ChatDetails
-from elia_chat.seven_adapter import call_seven_router
+from elia_chat.seven_adapter import acall_seven_router
 from elia_chat.widgets.agent_is_typing import ResponseStatus
 from elia_chat.widgets.chat_header import ChatHeader, TitleStatic
 from elia_chat.widgets.prompt_input import PromptInput
@@ -34,12 +34,21 @@ if TYPE_CHECKING:
     )
 
 
+_UTC = timezone.utc
+
+# Identical routing statuses posted within this window are coalesced
+_STATUS_REPEAT_WINDOW_S = 0.05
+
+# Histories longer than this build their Chatboxes on a worker thread
+_THREADED_HISTORY_MIN_MESSAGES = 50
+
+
 class ChatPromptInput(PromptInput):
-    BINDINGS = [Binding("escape", "app.pop_screen", "Close chat", key_display="esc")]
+    BINDINGS = (Binding("escape", "app.pop_screen", "Close chat", key_display="esc"),)
 
 
 class Chat(Widget):
-    BINDINGS = [
+    BINDINGS = (
         Binding("ctrl+r", "rename", "Rename", key_display="^r"),
         Binding("shift+down", "scroll_container_down", show=False),
         Binding("shift+up", "scroll_container_up", show=False),
@@ -57,7 +66,7 @@ class Chat(Widget):
             show=False,
         ),
         Binding(key="f2", action="details", description="Chat info"),
-    ]
+    )
 
     allow_input_submit = reactive(True)
     """Used to lock the chat input while the agent is responding."""
@@ -67,43 +76,50 @@ class Chat(Widget):
         self.chat_data = chat_data
         self.elia = cast("Elia", self.app)
         self.model = chat_data.model
+        self._last_status: tuple[str | None, float] = (None, 0.0)
+        """The last routing status posted and its monotonic timestamp."""
 
-    @dataclass
+    @dataclass(slots=True)
     class AgentResponseStarted(Message):
         pass
 
-    @dataclass
+    @dataclass(slots=True)
     class RoutingStatusUpdate(Message):
         """Sent when SEVEN routing status changes (e.g., local_starting, api_fetching)."""
 
         status: str
 
-    @dataclass
+    @dataclass(slots=True)
     class AgentResponseComplete(Message):
         chat_id: int | None
         message: ChatMessage
         chatbox: Chatbox
         source_label: str | None = None
 
-    @dataclass
+    @dataclass(slots=True)
     class AgentResponseFailed(Message):
         """Sent when the agent fails to respond e.g. cant connect.
         Can be used to reset UI state."""
 
         last_message: ChatMessage
 
-    @dataclass
+    @dataclass(slots=True)
     class NewUserMessage(Message):
         content: str
 
     def compose(self) -> ComposeResult:
+        # Keep references to the children handlers use on every send/receive,
+        # so they don't walk the DOM with query_one each time
         yield ResponseStatus()
-        yield ChatHeader(chat=self.chat_data, model=self.model)
+        self._chat_header = ChatHeader(chat=self.chat_data, model=self.model)
+        yield self._chat_header
 
         with VerticalScroll(id="chat-container") as vertical_scroll:
             vertical_scroll.can_focus = False
+        self._chat_container = vertical_scroll
 
-        yield ChatPromptInput(id="prompt")
+        self._prompt_input = ChatPromptInput(id="prompt")
+        yield self._prompt_input
 
     async def on_mount(self, _: events.Mount) -> None:
         """
@@ -113,7 +129,7 @@ class Chat(Widget):
 
     @property
     def chat_container(self) -> VerticalScroll:
-        return self.query_one("#chat-container", VerticalScroll)
+        return self._chat_container
 
     @property
     def is_empty(self) -> bool:
@@ -129,12 +145,12 @@ class Chat(Widget):
     def restore_state_on_agent_failure(self, event: Chat.AgentResponseFailed) -> None:
         original_prompt = event.last_message.message.get("content", "")
         if isinstance(original_prompt, str):
-            self.query_one(ChatPromptInput).text = original_prompt
+            self._prompt_input.text = original_prompt
 
     async def new_user_message(self, content: str) -> None:
         log.debug(f"User message submitted in chat {self.chat_data.id!r}: {content!r}")
 
-        now_utc = datetime.datetime.now(datetime.timezone.utc)
+        now_utc = datetime.now(_UTC)
         user_message: ChatCompletionUserMessageParam = {
             "content": content,
             "role": "user",
@@ -157,11 +173,11 @@ class Chat(Widget):
             chat_id=self.chat_data.id, message=user_chat_message
         )
 
-        prompt = self.query_one(ChatPromptInput)
+        prompt = self._prompt_input
         prompt.submit_ready = False
         self.stream_agent_response()
 
-    @work(thread=True, group="agent_response")
+    @work(group="agent_response")
     async def stream_agent_response(self) -> None:
         log.debug(
             "Routing chat %s through SEVEN backend (messages=%s)",
@@ -171,11 +187,18 @@ class Chat(Widget):
 
         self.post_message(self.AgentResponseStarted())
         try:
-            # Create callback to post routing status updates to UI
+            # Create callback to post routing status updates to UI; it runs on
+            # the routing thread, and post_message is thread-safe
             def on_routing_status_change(status: str) -> None:
+                # Drop repeats of the same status in quick succession
+                now = time.monotonic()
+                last_status, last_posted = self._last_status
+                if status == last_status and now - last_posted < _STATUS_REPEAT_WINDOW_S:
+                    return
+                self._last_status = (status, now)
                 self.post_message(self.RoutingStatusUpdate(status=status))
 
-            seven_result = call_seven_router(
+            seven_result = await acall_seven_router(
                 messages=self.chat_data.messages,
                 runtime_config=self.elia.runtime_config,
                 on_status_change=on_routing_status_change,
@@ -218,8 +241,8 @@ class Chat(Widget):
         )
         response_chatbox.border_title = seven_result.source_label
 
-        self.app.call_from_thread(self.chat_container.mount, response_chatbox)
-        self.app.call_from_thread(self.scroll_to_latest_message)
+        await self.chat_container.mount(response_chatbox)
+        self.scroll_to_latest_message()
 
         self.post_message(
             self.AgentResponseComplete(
@@ -230,29 +253,16 @@ class Chat(Widget):
             )
         )
 
-    @on(AgentResponseFailed)
-    @on(AgentResponseStarted)
-    async def agent_started_responding(
-        self, event: AgentResponseFailed | AgentResponseStarted
-    ) -> None:
-        try:
-            awaiting_reply = self.chat_container.query_one("#awaiting-reply", Label)
-        except NoMatches:
-            pass
-        else:
-            if awaiting_reply:
-                await awaiting_reply.remove()
-
     @on(AgentResponseComplete)
     async def agent_finished_responding(self, event: AgentResponseComplete) -> None:
         # Ensure the thread is updated with the message from the agent
         self.chat_data.messages.append(event.message)
         event.chatbox.border_title = event.source_label or "Agent"
         event.chatbox.remove_class("response-in-progress")
-        prompt = self.query_one(ChatPromptInput)
+        prompt = self._prompt_input
         prompt.submit_ready = True
 
-        header = self.query_one(ChatHeader)
+        header = self._chat_header
         await header.refresh_energy_totals()
 
     @on(PromptInput.PromptSubmitted)
@@ -271,18 +281,23 @@ class Chat(Widget):
 
     @on(Chatbox.CursorEscapingBottom)
     def move_focus_to_prompt(self) -> None:
-        self.query_one(ChatPromptInput).focus()
+        self._prompt_input.focus()
 
     @on(TitleStatic.ChatRenamed)
     async def handle_chat_rename(self, event: TitleStatic.ChatRenamed) -> None:
         if event.chat_id == self.chat_data.id and event.new_title:
             self.chat_data.title = event.new_title
-            header = self.query_one(ChatHeader)
+            header = self._chat_header
             header.update_header(self.chat_data, self.model)
             await ChatsManager.rename_chat(event.chat_id, event.new_title)
 
     def get_latest_chatbox(self) -> Chatbox:
-        return self.query(Chatbox).last()
+        # Chatboxes are mounted in order as direct children of the container,
+        # so scan from the end rather than querying the whole subtree
+        for child in reversed(self.chat_container.children):
+            if isinstance(child, Chatbox):
+                return child
+        raise NoMatches("No Chatbox in the chat container")
 
     def focus_latest_message(self) -> None:
         try:
@@ -298,10 +313,10 @@ class Chat(Widget):
         self.focus_latest_message()
 
     def action_focus_first_message(self) -> None:
-        try:
-            self.query(Chatbox).first().focus()
-        except NoMatches:
-            pass
+        for child in self.chat_container.children:
+            if isinstance(child, Chatbox):
+                child.focus()
+                return
 
     def action_scroll_container_up(self) -> None:
         if self.chat_container:
@@ -315,13 +330,22 @@ class Chat(Widget):
         await self.app.push_screen(ChatDetails(self.chat_data))
 
     async def load_chat(self, chat_data: ChatData) -> None:
-        chatboxes = [
-            Chatbox(chat_message, chat_data.model)
-            for chat_message in chat_data.non_system_messages
-        ]
-        await self.chat_container.mount_all(chatboxes)
+        def build_chatboxes() -> tuple[Chatbox, ...]:
+            return tuple(
+                Chatbox(chat_message, chat_data.model)
+                for chat_message in chat_data.non_system_messages
+            )
+
+        # Construct long histories off the event loop; mounting stays on it
+        if len(chat_data.messages) > _THREADED_HISTORY_MIN_MESSAGES:
+            chatboxes = await asyncio.to_thread(build_chatboxes)
+        else:
+            chatboxes = build_chatboxes()
+        # Hold screen updates until the whole history is mounted
+        with self.app.batch_update():
+            await self.chat_container.mount_all(chatboxes)
         self.chat_container.scroll_end(animate=False, force=True)
-        chat_header = self.query_one(ChatHeader)
+        chat_header = self._chat_header
         chat_header.update_header(
             chat=chat_data,
             model=chat_data.model,
@@ -330,7 +354,7 @@ class Chat(Widget):
         # If the last message didn't receive a response, try again.
         messages = chat_data.messages
         if messages and messages[-1].message["role"] == "user":
-            prompt = self.query_one(ChatPromptInput)
+            prompt = self._prompt_input
             prompt.submit_ready = False
             self.stream_agent_response()
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 
 from rich.console import ConsoleRenderable, RichCast
-from rich.markup import escape
 
 from textual.app import ComposeResult
 from textual.message import Message
@@ -11,6 +11,7 @@ from textual.widgets import Static
 
 from elia_chat.chats_manager import ChatsManager
 from elia_chat.config import EliaChatModel
+from elia_chat.markup import escape_markup
 from elia_chat.models import ChatData
 from elia_chat.screens.rename_chat_screen import RenameChat
 
@@ -71,32 +72,42 @@ class ChatHeader(Widget):
         self.model = model
         self._energy_used_wh = 0.0
         self._energy_saved_wh = 0.0
+        # Content last applied to each Static, keyed by widget id
+        self._shown_content: dict[str, str] = {}
 
     def update_header(self, chat: ChatData, model: EliaChatModel):
         self.chat = chat
         self.model = model
 
-        model_static = self.query_one("#model-static", Static)
-        title_static = self.query_one("#title-static", Static)
-        energy_static = self.query_one("#energy-static", Static)
+        self._update_static("model-static", self.model_static_content())
+        self._update_static("title-static", self.title_static_content())
+        self._update_static("energy-static", self.energy_static_content())
 
-        model_static.update(self.model_static_content())
-        title_static.update(self.title_static_content())
-        energy_static.update(self.energy_static_content())
+    def _update_static(self, static_id: str, content: str) -> None:
+        """Update a Static only when its content differs from what it shows."""
+        if self._shown_content.get(static_id) == content:
+            return
+        self._shown_content[static_id] = content
+        self.query_one(f"#{static_id}", Static).update(content)
 
     def title_static_content(self) -> str:
         chat = self.chat
-        content = escape(chat.title or chat.short_preview) if chat else "Empty chat"
+        content = escape_markup(chat.title or chat.short_preview) if chat else "Empty chat"
         return f"[@click=rename_chat]{content}[/]"
 
     def model_static_content(self) -> str:
         model = self.model
-        return escape(model.display_name or model.name) if model else "Unknown model"
+        return escape_markup(model.display_name or model.name) if model else "Unknown model"
 
     def compose(self) -> ComposeResult:
-        yield TitleStatic(self.chat.id, self.title_static_content(), id="title-static")
-        yield Static(self.model_static_content(), id="model-static")
-        yield Static(self.energy_static_content(), id="energy-static")
+        self._shown_content = {
+            "title-static": self.title_static_content(),
+            "model-static": self.model_static_content(),
+            "energy-static": self.energy_static_content(),
+        }
+        yield TitleStatic(self.chat.id, self._shown_content["title-static"], id="title-static")
+        yield Static(self._shown_content["model-static"], id="model-static")
+        yield Static(self._shown_content["energy-static"], id="energy-static")
 
     async def on_mount(self) -> None:
         await self.refresh_energy_totals()
@@ -104,10 +115,11 @@ class ChatHeader(Widget):
     async def refresh_energy_totals(self) -> None:
         chat_id = self.chat.id
         used, saved = await ChatsManager.energy_totals(chat_id=chat_id)
+        if (used, saved) == (self._energy_used_wh, self._energy_saved_wh):
+            return
         self._energy_used_wh = used
         self._energy_saved_wh = saved
-        energy_static = self.query_one("#energy-static", Static)
-        energy_static.update(self.energy_static_content())
+        self._update_static("energy-static", self.energy_static_content())
 
     def energy_static_content(self) -> str:
         used = self._format_energy_value(self._energy_used_wh)
@@ -116,6 +128,12 @@ class ChatHeader(Widget):
 
     @staticmethod
     def _format_energy_value(value_wh: float) -> str:
-        if value_wh >= 1000.0:
-            return f"{value_wh / 1000.0:.2f} kWh"
-        return f"{value_wh:.2f} Wh"
+        return _format_energy(value_wh)
+
+
+@lru_cache(maxsize=256)
+def _format_energy(value_wh: float) -> str:
+    """Format watt-hours for display; totals repeat across refreshes, so cache."""
+    if value_wh >= 1000.0:
+        return f"{value_wh / 1000.0:.2f} kWh"
+    return f"{value_wh:.2f} Wh"
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 from textual import on
@@ -17,6 +18,24 @@ if TYPE_CHECKING:
     from elia_chat.app import Elia
 
 
+@lru_cache(maxsize=1)
+def _cached_local_profiles() -> tuple[tuple[str, str], ...]:
+    """Local (slug, label) pairs, built once rather than on every modal open."""
+    return tuple(list_local_profiles().items())
+
+
+@lru_cache(maxsize=1)
+def _cached_cloud_profiles() -> tuple[tuple[str, str], ...]:
+    """Cloud (slug, label) pairs, built once rather than on every modal open."""
+    return tuple(list_cloud_profiles().items())
+
+
+def invalidate_profile_cache() -> None:
+    """Drop the cached profile lists, e.g. after the profile catalog changes."""
+    _cached_local_profiles.cache_clear()
+    _cached_cloud_profiles.cache_clear()
+
+
 class ProfileRadioButton(RadioButton):
     """Radio button carrying an energy profile slug."""
 
@@ -61,8 +80,8 @@ class OptionsModal(ModalScreen[RuntimeConfig]):
         self.runtime_config = self.elia.runtime_config
 
     def compose(self) -> ComposeResult:
-        local_profiles = list_local_profiles()
-        cloud_profiles = list_cloud_profiles()
+        local_profiles = _cached_local_profiles()
+        cloud_profiles = _cached_cloud_profiles()
         with VerticalScroll(id="form-scrollable") as vs:
             vs.border_title = "Energy Profiles"
             vs.can_focus = False
@@ -74,7 +93,7 @@ class OptionsModal(ModalScreen[RuntimeConfig]):
             yield Static(description, id="profiles-description")
             with RadioSet(id="local-profiles") as local_rs:
                 local_rs.border_title = "Local Hardware"
-                for slug, label in local_profiles.items():
+                for slug, label in local_profiles:
                     yield ProfileRadioButton(
                         slug=slug,
                         label=label,
@@ -82,7 +101,7 @@ class OptionsModal(ModalScreen[RuntimeConfig]):
                     )
             with RadioSet(id="cloud-profiles") as cloud_rs:
                 cloud_rs.border_title = "Cloud Baseline"
-                for slug, label in cloud_profiles.items():
+                for slug, label in cloud_profiles:
                     yield ProfileRadioButton(
                         slug=slug,
                         label=label,
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import math
+
 from textual.widgets import Static
 
 from elia_chat.chats_manager import ChatsManager
 from elia_chat.widgets.chat_header import ChatHeader
-from elia_chat.energy_equivalents import random_equivalent
+from elia_chat.energy_equivalents import describe_equivalent, random_equivalent_index
 
 
 class EnergyStats(Static):
@@ -19,13 +21,29 @@ class EnergyStats(Static):
         disabled: bool = False,
     ) -> None:
         super().__init__("", name=name, id=id, classes=classes, disabled=disabled)
+        self._totals: tuple[float, float] | None = None
+        self._equivalent_bucket: int | None = None
+        self._equivalent_index = 0
+        self._shown = ""
 
     async def on_mount(self) -> None:
         await self.refresh_stats()
 
     async def refresh_stats(self) -> None:
         used, saved = await ChatsManager.energy_totals(chat_id=None)
+        if (used, saved) == self._totals:
+            return
+        self._totals = (used, saved)
         used_text = ChatHeader._format_energy_value(used)
         saved_text = ChatHeader._format_energy_value(saved)
-        equivalent = random_equivalent(saved)
-        self.update(f"⚡ {used_text} used · 🌱 {saved_text} saved · {equivalent}")
+        # Keep the same equivalent until savings cross a half-decade boundary,
+        # so the line doesn't switch comparisons after every reply
+        bucket = math.floor(math.log10(saved) * 2) if saved > 0 else None
+        if bucket != self._equivalent_bucket:
+            self._equivalent_bucket = bucket
+            self._equivalent_index = random_equivalent_index()
+        equivalent = describe_equivalent(self._equivalent_index, saved)
+        content = f"⚡ {used_text} used · 🌱 {saved_text} saved · {equivalent}"
+        if content != self._shown:
+            self._shown = content
+            self.update(content)
@@ -3,6 +3,7 @@ no chat history.
 """
 
 from rich.console import RenderableType
+from rich.text import Text
 from textual.widgets import Static
 
 
@@ -52,7 +53,7 @@ Intelligent routing isn't optimization—it's infrastructure for sustainable AI.
     BORDER_TITLE = "SEVEN - Intelligent Routing for Sustainable AI"
 
     def render(self) -> RenderableType:
-        return self.MESSAGE
+        return _RENDERED_MESSAGE
 
     def _action_open_repo(self) -> None:
         import webbrowser
@@ -63,3 +64,7 @@ Intelligent routing isn't optimization—it's infrastructure for sustainable AI.
         import webbrowser
 
         webbrowser.open("https://github.com/Jaundel/SEVEN/issues")
+
+
+# The message is static, so parse its markup once instead of on every paint
+_RENDERED_MESSAGE = Text.from_markup(Welcome.MESSAGE)
@@ -9,35 +9,115 @@
 
 from __future__ import annotations
 
-import argparse
-import asyncio
+import os
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-REPO_ROOT = Path(__file__).resolve().parent
-ELIA_APP_DIR = REPO_ROOT / "apps" / "elia"
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Plain strings: sys.path needs str anyway. realpath keeps symlinked
+# launchers pointing at the checkout they live in.
+REPO_ROOT = os.path.dirname(os.path.realpath(__file__))
+ELIA_APP_DIR = os.path.join(REPO_ROOT, "apps", "elia")
+
+_PATHS_BOOTSTRAPPED = False
 
 
 def _bootstrap_paths() -> None:
     """Ensure both the Elia app and SEVEN package are importable."""
-    for path in (ELIA_APP_DIR, REPO_ROOT):
-        path_str = str(path)
-        if path_str not in sys.path:
-            sys.path.insert(0, path_str)
+    global _PATHS_BOOTSTRAPPED
+    if _PATHS_BOOTSTRAPPED:
+        return
+
+    existing = set(sys.path)
+    # One slice assignment; the repo root ends up ahead of the Elia app dir
+    sys.path[:0] = [path for path in (REPO_ROOT, ELIA_APP_DIR) if path not in existing]
+    _PATHS_BOOTSTRAPPED = True
+
+
+def _ensure_database_exists() -> Future[None] | None:
+    """Create the database if it doesn't exist.
+
+    Returns:
+        A future for the schema creation, which runs on a background thread
+        so it overlaps the UI import, or None if the database already exists.
+    """
+    from elia_chat.locations import database_file
 
+    # Check before importing the database layer so warm starts skip SQLModel
+    db_path = database_file()
+    if os.path.exists(db_path):
+        _prewarm_database(db_path.as_uri())
+        return None
 
-def _ensure_database_exists() -> None:
-    """Create the database if it doesn't exist."""
-    from elia_chat.database.database import create_database, sqlite_file_name
-    # Import models to ensure they're registered with SQLModel metadata
+    import threading
+    from concurrent.futures import Future
+
+    from elia_chat.database.database import create_database_sync, sqlite_file_name
+    # Import the models on this thread, so the worker never imports modules
+    # concurrently with the UI import and risks a partially initialized one
     import elia_chat.database.models  # noqa: F401
 
-    if not sqlite_file_name.exists():
-        print(f"Creating database at {sqlite_file_name}")
-        asyncio.run(create_database())
+    print(f"Creating database at {sqlite_file_name}")
+    created: Future[None] = Future()
+
+    def create() -> None:
+        try:
+            create_database_sync()
+        except BaseException as exc:
+            created.set_exception(exc)
+        else:
+            created.set_result(None)
+
+    # Not a daemon, so a failing UI import can't abandon a half-written schema
+    threading.Thread(target=create, name="seven-db-create").start()
+    return created
+
+
+def _prewarm_database(db_uri: str) -> None:
+    """Read the schema pages on a background thread while the UI stack imports.
+
+    Elia's first query then finds them in the OS page cache instead of on disk.
+    """
+    import threading
 
+    def read_schema() -> None:
+        import sqlite3
+
+        try:
+            conn = sqlite3.connect(f"{db_uri}?mode=ro", uri=True)
+            try:
+                conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass  # Purely an optimization; Elia reports real database errors
+
+    threading.Thread(target=read_schema, name="seven-db-prewarm", daemon=True).start()
+
+
+def parse_prompt(argv: list[str] | None = None) -> str:
+    """Return the startup prompt given on the command line ("" if none).
+
+    The fixed -p/--prompt shapes are matched by hand so normal launches never
+    import argparse; anything else (--help, typos, repeats) goes to the full
+    parser for its usual help and error output.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        return ""
+    if len(args) == 2 and args[0] in ("-p", "--prompt") and not args[1].startswith("-"):
+        return args[1]
+    if len(args) == 1 and args[0].startswith("--prompt="):
+        return args[0][len("--prompt=") :]
+    return _parse_with_argparse(args)
+
+
+def _parse_with_argparse(args: list[str]) -> str:
+    """Parse the arguments with argparse, which also handles --help and errors."""
+    import argparse
 
-def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Launch SEVEN (Sustainable Energy Via Efficient Neural-routing) - "
         "An intelligent AI router that saves energy by directing simple queries to "
@@ -49,19 +129,38 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional prompt to pre-populate when SEVEN opens.",
     )
-    return parser.parse_args()
+    return parser.parse_args(args).prompt
+
+
+def _show_splash() -> None:
+    """Show a loading line while the UI stack imports, on interactive terminals only."""
+    if sys.stderr.isatty():
+        sys.stderr.write("Starting SEVEN...")
+        sys.stderr.flush()
+
+
+def _clear_splash() -> None:
+    """Erase the loading line so it isn't left behind when the TUI exits."""
+    if sys.stderr.isatty():
+        sys.stderr.write("\r\033[K")
+        sys.stderr.flush()
 
 
 def main() -> None:
-    args = parse_args()
+    startup_prompt = parse_prompt()
     _bootstrap_paths()
-    _ensure_database_exists()
+    database_created = _ensure_database_exists()
+    _show_splash()
 
+    # Imported only after argument parsing so --help never pays for the UI stack
     from elia_chat.app import Elia
     from elia_chat.config import LaunchConfig
 
     config = LaunchConfig.get_current()
-    app = Elia(config=config, startup_prompt=args.prompt)
+    app = Elia(config=config, startup_prompt=startup_prompt)
+    if database_created is not None:
+        database_created.result()
+    _clear_splash()
     app.run()
 
 